@@ -1,11 +1,53 @@
+import bisect
 import csv
 from datetime import datetime, timedelta
 import os
+import re
+import sqlite3
+import struct
+import sys
 
-# --- Files renamed for use ---
+# All records live in a single SQLite database.
+DATABASE_FILE = 'salon.db'
+
+# Legacy flat-file stores from earlier versions, imported into the
+# database once if it is empty and they are present.
 CLIENTS_FILE = 'clients.txt'
 TECHNICIANS_FILE = 'technicians.txt'
-APPOINTMENTS_FILE = 'appointments.txt'
+APPOINTMENTS_FILE = 'appointments.dat'
+LEGACY_APPOINTMENTS_FILE = 'appointments.txt'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    client_id INTEGER PRIMARY KEY,
+    name      TEXT NOT NULL,
+    phone     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS technicians (
+    tech_id INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS appointments (
+    appt_id   INTEGER PRIMARY KEY,
+    date      TEXT NOT NULL,
+    time      TEXT NOT NULL,
+    client_id INTEGER NOT NULL REFERENCES clients(client_id),
+    tech_id   INTEGER NOT NULL REFERENCES technicians(tech_id),
+    service   TEXT NOT NULL,
+    price     REAL NOT NULL,
+    status    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_appt_client ON appointments(client_id);
+CREATE INDEX IF NOT EXISTS idx_appt_tech_date ON appointments(tech_id, date);
+"""
+
+# 1 MiB I/O buffer so sequential loads/saves make far fewer syscalls than
+# the platform default (commonly 8 KiB).
+FILE_BUFFER_SIZE = 1 << 20
+
+# Shape-only date check; much cheaper than datetime.strptime when the
+# parsed value is thrown away anyway.
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
 
 # --- Services offered and prices ---
 SERVICES = {
@@ -15,33 +57,100 @@ SERVICES = {
     '4': ('Gel Pedicure', 55.00)
 }
 
+# Immutable view of the valid service keys for menu validation.
+_SERVICE_KEYS = frozenset(SERVICES)
+
+# Record layout of the legacy packed appointments.dat file, kept only so
+# old data can be imported into the database.
+APPT_RECORD = struct.Struct('<Q10s5sQQBdB')
+_STATUS_NAMES = {1: 'Booked', 2: 'Canceled'}
+_SERVICE_NAMES = {int(key): name for key, (name, _price) in SERVICES.items()}
+
+# The service menu never changes, so format it once at import time.
+_SERVICES_MENU = "\n".join(f"{key}. {name} (${price:.2f})"
+                           for key, (name, price) in SERVICES.items())
+
 # --- CORE MODEL CLASSES ---
 
 class Client:
     """Represents a salon customer."""
+    __slots__ = ('client_id', 'name', 'phone', '_str_cache')
+
     def __init__(self, name, phone, client_id):
         self.client_id = client_id
         self.name = name
         self.phone = phone
+        # Clients are immutable once created, so cache the display string.
+        self._str_cache = f"C{client_id} - {name}"
 
     def __str__(self):
-        return f"C{self.client_id} - {self.name}"
+        return self._str_cache
 
 
 class Technician:
     """Represents a nail technician with their schedule."""
+    __slots__ = ('tech_id', 'name', 'availability', 'availability_set', 'schedule',
+                 '_sorted_schedule_dates', '_str_cache')
+
     def __init__(self, name, tech_id):
         self.tech_id = tech_id
         self.name = name
+        # Sorted lists for ordered display, mirrored by sets for O(1)
+        # membership tests and removals. Mutate only through the helpers
+        # below so the two stay in sync.
         self.availability = {}
+        self.availability_set = {}
+        # date -> {appt_id: Appointment}, so cancellation can drop an
+        # entry without rebuilding the day's list. The date keys are kept
+        # pre-sorted in _sorted_schedule_dates for the schedule view.
         self.schedule = {}
+        self._sorted_schedule_dates = []
+        self._str_cache = f"T{tech_id} - {name}"
+
+    def has_slot(self, date, time):
+        times = self.availability_set.get(date)
+        return times is not None and time in times
+
+    def add_slot(self, date, time):
+        bisect.insort(self.availability.setdefault(date, []), time)
+        self.availability_set.setdefault(date, set()).add(time)
+
+    def discard_slot(self, date, time):
+        """Drops the slot if present; returns True when something was removed."""
+        times = self.availability_set.get(date)
+        if times is None or time not in times:
+            return False
+        times.remove(time)
+        self.availability[date].remove(time)
+        if not times:
+            del self.availability[date]
+            del self.availability_set[date]
+        return True
+
+    def add_booking(self, date, appt):
+        day = self.schedule.get(date)
+        if day is None:
+            day = self.schedule[date] = {}
+            bisect.insort(self._sorted_schedule_dates, date)
+        day[appt.appt_id] = appt
+
+    def set_day_availability(self, date, times):
+        self.availability[date] = sorted(times)
+        self.availability_set[date] = set(times)
+
+    def clear_availability(self):
+        self.availability.clear()
+        self.availability_set.clear()
 
     def __str__(self):
-        return f"T{self.tech_id} - {self.name}"
+        return self._str_cache
 
 
 class Appointment:
     """Represents a booking instance."""
+    __slots__ = ('appt_id', 'date', 'time', 'client', 'technician', 'service', 'price', 'status',
+                 '_str_cache')
+
     def __init__(self, date, time, client, technician, appt_id, service, price, status="Booked"):
         self.appt_id = appt_id
         self.date = date
@@ -51,11 +160,33 @@ class Appointment:
         self.service = service
         self.price = float(price)
         self.status = status
+        self._str_cache = None
 
     def __str__(self):
-        status_info = f" | Status: {self.status}" if self.status != "Booked" else ""
-        return (f"[{self.appt_id}] {self.date} @ {self.time} | Service: {self.service} (${self.price:.2f})"
+        # Built lazily and invalidated on status change, so repeated menu
+        # listings return the cached string instead of reformatting.
+        if self._str_cache is None:
+            status_info = f" | Status: {self.status}" if self.status != "Booked" else ""
+            self._str_cache = (
+                f"[{self.appt_id}] {self.date} @ {self.time} | Service: {self.service} (${self.price:.2f})"
                 f"{status_info}\n    - Technician: {self.technician.name} | Client: {self.client.name}")
+        return self._str_cache
+
+    @classmethod
+    def _from_record(cls, rec, client, technician):
+        """Bulk-load factory: builds an instance via __new__ and direct slot
+        assignment from a database row."""
+        appt = cls.__new__(cls)
+        appt.appt_id = str(rec[0])
+        appt.date = rec[1]
+        appt.time = rec[2]
+        appt.client = client
+        appt.technician = technician
+        appt.service = rec[5]
+        appt.price = rec[6]
+        appt.status = rec[7]
+        appt._str_cache = None
+        return appt
 
 
 # --- BOOKING MANAGER (Controller) ---
@@ -65,111 +196,168 @@ class BookingManager:
     def __init__(self):
         self.clients = {}
         self.technicians = {}
+        # Materialized Appointment objects, built lazily from database
+        # rows by _materialize_appointment.
         self.appointments = {}
         self._next_client_id = 101
         self._next_tech_id = 201
         self._next_appt_id = 3001
+        self._conn = sqlite3.connect(DATABASE_FILE)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
         self._load_initial_data()
-        self._update_next_ids()
+
+    def _migrate_legacy_files(self):
+        """One-time import of the old flat-file stores into the database."""
+        if (self._conn.execute("SELECT COUNT(*) FROM clients").fetchone()[0] == 0
+                and os.path.exists(CLIENTS_FILE)):
+            with open(CLIENTS_FILE, mode='r', newline='', buffering=FILE_BUFFER_SIZE) as file:
+                rows = list(csv.reader(file.read().splitlines()))
+            records = [(int(row[0]), row[1], row[2]) for row in rows[1:] if row]
+            self._conn.executemany("INSERT OR IGNORE INTO clients VALUES (?, ?, ?)", records)
+            print(f"SUCCESS: Migrated {len(records)} clients from {CLIENTS_FILE} to {DATABASE_FILE}.")
+        if (self._conn.execute("SELECT COUNT(*) FROM technicians").fetchone()[0] == 0
+                and os.path.exists(TECHNICIANS_FILE)):
+            with open(TECHNICIANS_FILE, mode='r', newline='', buffering=FILE_BUFFER_SIZE) as file:
+                rows = list(csv.reader(file.read().splitlines()))
+            records = [(int(row[0]), row[1]) for row in rows[1:] if row]
+            self._conn.executemany("INSERT OR IGNORE INTO technicians VALUES (?, ?)", records)
+            print(f"SUCCESS: Migrated {len(records)} technicians from {TECHNICIANS_FILE} to {DATABASE_FILE}.")
+        if self._conn.execute("SELECT COUNT(*) FROM appointments").fetchone()[0] == 0:
+            if os.path.exists(APPOINTMENTS_FILE):
+                self._migrate_packed_appointments()
+            elif os.path.exists(LEGACY_APPOINTMENTS_FILE):
+                self._migrate_csv_appointments()
+        self._conn.commit()
+
+    def _migrate_packed_appointments(self):
+        """Imports the legacy fixed-width binary appointments file."""
+        with open(APPOINTMENTS_FILE, mode='rb', buffering=FILE_BUFFER_SIZE) as file:
+            data = file.read()
+        usable = len(data) - len(data) % APPT_RECORD.size
+        records = [(rec[0], rec[1].decode(), rec[2].decode().rstrip('\x00'),
+                    rec[3], rec[4], _SERVICE_NAMES.get(rec[5], "Unknown"),
+                    rec[6], _STATUS_NAMES.get(rec[7], "Booked"))
+                   for rec in APPT_RECORD.iter_unpack(data[:usable])]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO appointments VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records)
+        print(f"SUCCESS: Migrated {len(records)} appointments from {APPOINTMENTS_FILE} to {DATABASE_FILE}.")
+
+    def _migrate_csv_appointments(self):
+        """Imports the original CSV appointments file."""
+        with open(LEGACY_APPOINTMENTS_FILE, mode='r', newline='', buffering=FILE_BUFFER_SIZE) as file:
+            rows = list(csv.reader(file.read().splitlines()))
+        records = [(int(row[0]), row[1], row[2], int(row[3]), int(row[4]),
+                    row[5], float(row[6]), row[7].rstrip())
+                   for row in rows[1:] if row]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO appointments VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records)
+        print(f"SUCCESS: Migrated {len(records)} appointments from {LEGACY_APPOINTMENTS_FILE} to {DATABASE_FILE}.")
 
     def _load_clients(self):
-        if not os.path.exists(CLIENTS_FILE):
-            return
-        with open(CLIENTS_FILE, mode='r', newline='') as file:
-            reader = csv.reader(file)
-            next(reader)
-            for row in reader:
-                client_id, name, phone = row
-                self.clients[client_id] = Client(name, phone, client_id)
-        print(f"SUCCESS: Loaded {len(self.clients)} clients from {CLIENTS_FILE}.")
+        max_id = self._next_client_id - 1
+        for client_id, name, phone in self._conn.execute(
+                "SELECT client_id, name, phone FROM clients"):
+            self.clients[str(client_id)] = Client(name, phone, str(client_id))
+            max_id = max(max_id, client_id)
+        self._next_client_id = max_id + 1
+        print(f"SUCCESS: Loaded {len(self.clients)} clients from {DATABASE_FILE}.")
 
     def _save_client(self, client: Client):
-        file_exists = os.path.exists(CLIENTS_FILE) and os.path.getsize(CLIENTS_FILE) > 0
-        with open(CLIENTS_FILE, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            if not file_exists:
-                writer.writerow(['client_id', 'name', 'phone'])
-            writer.writerow([client.client_id, client.name, client.phone])
+        self._conn.execute("INSERT INTO clients VALUES (?, ?, ?)",
+                           (int(client.client_id), client.name, client.phone))
+        self._conn.commit()
 
     def _load_technicians(self):
-        if not os.path.exists(TECHNICIANS_FILE):
-            return
-        with open(TECHNICIANS_FILE, mode='r', newline='') as file:
-            reader = csv.reader(file)
-            next(reader)
-            for row in reader:
-                tech_id, name = row
-                self.technicians[tech_id] = Technician(name, tech_id)
-        print(f"SUCCESS: Loaded {len(self.technicians)} technicians from {TECHNICIANS_FILE}.")
+        max_id = self._next_tech_id - 1
+        for tech_id, name in self._conn.execute(
+                "SELECT tech_id, name FROM technicians"):
+            self.technicians[str(tech_id)] = Technician(name, str(tech_id))
+            max_id = max(max_id, tech_id)
+        self._next_tech_id = max_id + 1
+        print(f"SUCCESS: Loaded {len(self.technicians)} technicians from {DATABASE_FILE}.")
 
     def _save_technician(self, technician: Technician):
-        file_exists = os.path.exists(TECHNICIANS_FILE) and os.path.getsize(TECHNICIANS_FILE) > 0
-        with open(TECHNICIANS_FILE, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            if not file_exists:
-                writer.writerow(['tech_id', 'name'])
-            writer.writerow([technician.tech_id, technician.name])
-
-    def _load_appointments(self):
-        """Loads appointments and rebuilds technician schedules."""
-        if not os.path.exists(APPOINTMENTS_FILE):
-            return 0
-        count = 0
-        with open(APPOINTMENTS_FILE, mode='r', newline='') as file:
-            reader = csv.reader(file)
-            next(reader)
-            for row in reader:
-                (appt_id, date, time, client_id, tech_id, service, price, status) = row
-                client = self.clients.get(client_id)
-                tech = self.technicians.get(tech_id)
-                if not all([client, tech]):
-                    print(f"WARNING: Skipping Appt {appt_id}. Linked Client or Tech not found.")
-                    continue
-                new_appt = Appointment(date, time, client, tech, appt_id, service, price, status)
-                self.appointments[appt_id] = new_appt
-                count += 1
-                if date not in tech.schedule:
-                    tech.schedule[date] = []
-                tech.schedule[date].append(new_appt)
-                if status == "Booked":
-                    if date in tech.availability and time in tech.availability[date]:
-                        tech.availability[date].remove(time)
-        print(f"SUCCESS: Loaded {count} appointments from {APPOINTMENTS_FILE}.")
+        self._conn.execute("INSERT INTO technicians VALUES (?, ?)",
+                           (int(technician.tech_id), technician.name))
+        self._conn.commit()
+
+    def _load_appointment_state(self):
+        """Subtracts booked slots from availability and advances the
+        appointment ID counter; rows stay in the database until an
+        appointment is actually accessed."""
+        for appt_id, tech_id, date, time in self._conn.execute(
+                "SELECT appt_id, tech_id, date, time FROM appointments "
+                "WHERE status = 'Booked'"):
+            tech = self.technicians.get(str(tech_id))
+            if tech is not None:
+                tech.discard_slot(date, time)
+        count, max_id = self._conn.execute(
+            "SELECT COUNT(*), MAX(appt_id) FROM appointments").fetchone()
+        if max_id is not None:
+            self._next_appt_id = max(self._next_appt_id, max_id + 1)
+        print(f"SUCCESS: Loaded {count} appointments from {DATABASE_FILE}.")
         return count
 
-    def _rewrite_appointments_file(self):
-        """Rewrites the entire appointments file with the current state of appointments."""
-        appointments_to_save = [appt for appt in self.appointments.values()
-                                if appt.status in ["Booked", "Canceled"]]
-        with open(APPOINTMENTS_FILE, mode='w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(['appt_id', 'date', 'time', 'client_id', 'tech_id', 'service', 'price', 'status'])
-            for appt in appointments_to_save:
-                writer.writerow([
-                    appt.appt_id,
-                    appt.date,
-                    appt.time,
-                    appt.client.client_id,
-                    appt.technician.tech_id,
-                    appt.service,
-                    f"{appt.price:.2f}",
-                    appt.status
-                ])
-
-    def _update_next_ids(self):
-        """Sets the next ID counters based on the maximum ID loaded from files."""
-        if self.clients:
-            max_client_id = max(int(cid) for cid in self.clients.keys())
-            self._next_client_id = max_client_id + 1
-        if self.technicians:
-            max_tech_id = max(int(tid) for tid in self.technicians.keys())
-            self._next_tech_id = max_tech_id + 1
-        if self.appointments:
-            max_appt_id = max(int(aid) for aid in self.appointments.keys())
-            self._next_appt_id = max_appt_id + 1
+    def _materialize_appointment(self, appt_id):
+        """Returns the Appointment for appt_id, constructing it from its
+        database row on first access; None if the ID is unknown."""
+        appt = self.appointments.get(appt_id)
+        if appt is not None:
+            return appt
+        try:
+            key = int(appt_id)
+        except ValueError:
+            return None
+        rec = self._conn.execute(
+            "SELECT appt_id, date, time, client_id, tech_id, service, price, status "
+            "FROM appointments WHERE appt_id = ?", (key,)).fetchone()
+        if rec is None:
+            return None
+        client = self.clients.get(str(rec[3]))
+        tech = self.technicians.get(str(rec[4]))
+        if client is None or tech is None:
+            print(f"WARNING: Skipping Appt {appt_id}. Linked Client or Tech not found.")
+            return None
+        appt = Appointment._from_record(rec, client, tech)
+        self.appointments[appt_id] = appt
+        tech.add_booking(appt.date, appt)
+        return appt
+
+    def _materialize_technician_schedule(self, tech_id):
+        """Materializes every appointment for one technician so the
+        schedule view sees the complete picture."""
+        for (appt_id,) in self._conn.execute(
+                "SELECT appt_id FROM appointments WHERE tech_id = ?",
+                (int(tech_id),)):
+            self._materialize_appointment(str(appt_id))
+
+    def appointments_for_client(self, client_id):
+        """Returns the client's appointments in booking order."""
+        appts = []
+        for (appt_id,) in self._conn.execute(
+                "SELECT appt_id FROM appointments WHERE client_id = ? ORDER BY appt_id",
+                (int(client_id),)):
+            appt = self._materialize_appointment(str(appt_id))
+            if appt is not None:
+                appts.append(appt)
+        return appts
+
+    def _insert_appointment(self, appt):
+        self._conn.execute(
+            "INSERT INTO appointments VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (int(appt.appt_id), appt.date, appt.time, int(appt.client.client_id),
+             int(appt.technician.tech_id), appt.service, appt.price, appt.status))
+        self._conn.commit()
+
+    def _update_appointment_status(self, appt):
+        self._conn.execute("UPDATE appointments SET status = ? WHERE appt_id = ?",
+                           (appt.status, int(appt.appt_id)))
+        self._conn.commit()
 
     def _load_initial_data(self):
-        """Load data from files and then apply initial availability/schedule."""
+        """Migrate legacy files, load data, then apply initial availability/schedule."""
+        self._migrate_legacy_files()
         self._load_clients()
         self._load_technicians()
         alice = next((t for t in self.technicians.values() if t.name == "Alice"), None)
@@ -178,11 +366,11 @@ class BookingManager:
             alice = self.create_technician("Alice")
         if not bob:
             bob = self.create_technician("Bob")
-        alice.availability = {}
-        bob.availability = {}
-        alice.availability['2025-11-21'] = ["10:00", "11:00", "15:00"]
-        bob.availability['2025-11-21'] = ["14:00", "16:00"]
-        self._load_appointments()
+        alice.clear_availability()
+        bob.clear_availability()
+        alice.set_day_availability('2025-11-21', ["10:00", "11:00", "15:00"])
+        bob.set_day_availability('2025-11-21', ["14:00", "16:00"])
+        self._load_appointment_state()
         if not self.clients:
             self.create_client("Cathy Smith", "555-1234")
 
@@ -192,47 +380,41 @@ class BookingManager:
         """Creates an appointment if the slot is available."""
         client = self.clients.get(client_id)
         tech = self.technicians.get(tech_id)
-        if not all([client, tech]):
+        if client is None or tech is None:
             print("ERROR: Invalid Client or Technician ID.")
             return
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
+        if not _DATE_RE.fullmatch(date):
             print("ERROR: Invalid date format (use YYYY-MM-DD).")
             return
-        if date not in tech.availability or time not in tech.availability[date]:
+        if not tech.has_slot(date, time):
             print(f"ERROR: {tech.name} is not available at {time} on {date} (already booked or not scheduled).")
             return
         new_id = self._get_next_appt_id()
         new_appt = Appointment(date, time, client, tech, new_id, service, price)
-        if date not in tech.schedule:
-            tech.schedule[date] = []
-        tech.schedule[date].append(new_appt)
-        tech.availability[date].remove(time)
+        tech.add_booking(date, new_appt)
+        tech.discard_slot(date, time)
         self.appointments[new_appt.appt_id] = new_appt
-        self._rewrite_appointments_file()
+        self._insert_appointment(new_appt)
         print("\nSUCCESS: Booking Successful!")
         print(new_appt)
 
     def cancel_appointment(self, appt_id):
         """Cancels an appointment and restores technician availability."""
-        appt = self.appointments.get(appt_id)
+        appt = self._materialize_appointment(appt_id)
         if not appt or appt.status == "Canceled":
             print(f"ERROR: Appointment ID {appt_id} not found or already canceled.")
             return
         appt.status = "Canceled"
+        appt._str_cache = None
         print(f"SUCCESS: Appointment {appt_id} canceled.")
-        self._rewrite_appointments_file()
+        self._update_appointment_status(appt)
         tech = appt.technician
         date = appt.date
         time = appt.time
         if date in tech.schedule:
-            tech.schedule[date] = [a for a in tech.schedule.get(date, []) if a.appt_id != appt_id]
-        if date not in tech.availability:
-            tech.availability[date] = []
-        if time not in tech.availability[date]:
-            tech.availability[date].append(time)
-            tech.availability[date].sort()
+            tech.schedule[date].pop(appt_id, None)
+        if not tech.has_slot(date, time):
+            tech.add_slot(date, time)
             print(f"Technician {tech.name}'s slot on {date} at {time} restored.")
         else:
             print(f"Technician {tech.name}'s slot on {date} at {time} was already available (no restoration needed).")
@@ -252,18 +434,13 @@ class BookingManager:
         if not tech:
             print("ERROR: Technician ID not found.")
             return
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
+        if not _DATE_RE.fullmatch(date):
             print("ERROR: Invalid date format (use YYYY-MM-DD).")
             return
-        if date not in tech.availability:
-            tech.availability[date] = []
-        if time in tech.availability[date]:
+        if tech.has_slot(date, time):
             print(f"ERROR: {tech.name} is already available at {time} on {date}.")
             return
-        tech.availability[date].append(time)
-        tech.availability[date].sort()
+        tech.add_slot(date, time)
         print(f"SUCCESS: Slot {date} @ {time} added for {tech.name}.")
 
     def technician_remove_slot(self, tech_id, date, time):
@@ -271,10 +448,7 @@ class BookingManager:
         if not tech:
             print("ERROR: Technician ID not found.")
             return
-        if date in tech.availability and time in tech.availability[date]:
-            tech.availability[date].remove(time)
-            if not tech.availability[date]:
-                del tech.availability[date]
+        if tech.discard_slot(date, time):
             print(f"SUCCESS: Slot {date} @ {time} removed for {tech.name}.")
         else:
             print(f"ERROR: Slot {date} @ {time} not found in {tech.name}'s availability.")
@@ -364,11 +538,9 @@ def client_menu(client_id):
         choice = input("Enter choice (1-4): ").strip()
         if choice == '1':
             # --- SERVICE SELECTION ---
-            print("\n--- Service Selection ---")
-            for key, (name, price) in SERVICES.items():
-                print(f"{key}. {name} (${price:.2f})")
+            print("\n--- Service Selection ---\n" + _SERVICES_MENU)
             service_choice = input("Select a service (1-4): ").strip()
-            if service_choice not in SERVICES:
+            if service_choice not in _SERVICE_KEYS:
                 print("ERROR: Invalid service selection.")
                 continue
             selected_service, selected_price = SERVICES[service_choice]
@@ -390,12 +562,10 @@ def client_menu(client_id):
                 print("ERROR: Technician ID and Time cannot be empty.")
         elif choice == '2':
             print("\n--- Your Appointments ---")
-            found = False
-            for appt in MANAGER.appointments.values():
-                if appt.client.client_id == client_id:
-                    print(appt)
-                    found = True
-            if not found:
+            lines = [str(appt) for appt in MANAGER.appointments_for_client(client_id)]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            else:
                 print("You have no appointments booked.")
         elif choice == '3':
             appt_id = input("Enter Appointment ID to cancel (e.g., 3001): ").strip()
@@ -458,6 +628,7 @@ def technician_menu(tech_id):
             print("Input cannot be empty. Please enter a choice.")
             continue
         if choice == '1':
+            MANAGER._materialize_technician_schedule(tech_id)
             print(f"\n--- {tech.name}'s Schedule & Availability ---")
             print("\n**Current Availability Slots (Open for Booking):**")
             if tech.availability:
@@ -468,15 +639,15 @@ def technician_menu(tech_id):
                 print("  No future availability set.")
             print("\n**Booked/Past Appointments:**")
             found_schedule = False
-            sorted_dates = sorted(tech.schedule.keys())
-            for date in sorted_dates:
+            for date in tech._sorted_schedule_dates:
                 appts = tech.schedule[date]
                 if appts:
-                    print(f"  --- {date} ---")
-                    for appt in appts:
-                        print(
-                            f"    {appt.time} | Client: {appt.client.name} (ID: C{appt.client.client_id}) | Status: {appt.status}")
-                        found_schedule = True
+                    block = [f"  --- {date} ---"]
+                    block.extend(
+                        f"    {appt.time} | Client: {appt.client.name} (ID: C{appt.client.client_id}) | Status: {appt.status}"
+                        for appt in appts.values())
+                    sys.stdout.write("\n".join(block) + "\n")
+                    found_schedule = True
             if not found_schedule:
                 print("No appointments currently booked.")
         elif choice == '2':